@@ -63,6 +63,10 @@ HOROVOD_AUTOTUNE_LOG_FILEPATH = "/tmp/autotune_log.csv"
 # large number of machines.
 HOROVOD_GLOO_TIMEOUT_SECONDS = 240
 
+# The minimum number of seconds between tensorboard uploads triggered by training steps. Uploads
+# after validation and checkpoint workloads are never delayed.
+TRAINING_TENSORBOARD_SYNC_PERIOD_SECONDS = 60
+
 # The well-known locations of the executing container's STDOUT and STDERR.
 CONTAINER_STDOUT = "/run/determined/train/logs/stdout.log"
 CONTAINER_STDERR = "/run/determined/train/logs/stderr.log"
@@ -107,48 +107,49 @@ def build_and_run_training_pipeline(env: det.EnvContext) -> None:
         # workload manager is responsible for some generic workload hooks for things like timing
         # workloads, preparing checkpoints, and uploading completed checkpoints.  Finally, the
         # workload manager does some sanity checks on response messages that originate from the
-        # trial.
+        # trial. Closing the workload manager, which happens even if training fails, uploads
+        # anything it has not uploaded to checkpoint storage yet.
         #
         # TODO(ryan): Refactor WorkloadManager into separate layers that do each separate task.
-        workload_mgr = layers.build_workload_manager(
+        with layers.build_workload_manager(
             env,
             iter(socket_mgr),
             socket_mgr.get_rendezvous_info(),
             storage_mgr,
             tensorboard_mgr,
             tensorboard_writer,
-        )
-
-        workloads = iter(workload_mgr)
-        hvd_config = horovod.HorovodContext.from_configs(
-            env.experiment_config, socket_mgr.get_rendezvous_info(), env.hparams
-        )
-        logging.info(f"Horovod config: {hvd_config.__dict__}.")
-
-        # Load the checkpoint, if necessary. Any possible sinks to this pipeline will need access
-        # to this checkpoint.
-        with maybe_load_checkpoint(storage_mgr, env.latest_checkpoint) as load_path:
-
-            # Horovod distributed training is done inside subprocesses.
-            if hvd_config.use:
-                subproc = layers.SubprocessLauncher(
-                    env, workloads, load_path, socket_mgr.get_rendezvous_info(), hvd_config
-                )
-                subproc.run()
-            else:
-                if env.experiment_config.debug_enabled():
-                    faulthandler.dump_traceback_later(30, repeat=True)
-
-                with det._catch_sys_exit():
-                    with det._catch_init_invalid_hp(workloads):
-                        controller = load.prepare_controller(
-                            env,
-                            workloads,
-                            load_path,
-                            socket_mgr.get_rendezvous_info(),
-                            hvd_config,
-                        )
-                    controller.run()
+        ) as workload_mgr:
+
+            workloads = iter(workload_mgr)
+            hvd_config = horovod.HorovodContext.from_configs(
+                env.experiment_config, socket_mgr.get_rendezvous_info(), env.hparams
+            )
+            logging.info(f"Horovod config: {hvd_config.__dict__}.")
+
+            # Load the checkpoint, if necessary. Any possible sinks to this pipeline will need
+            # access to this checkpoint.
+            with maybe_load_checkpoint(storage_mgr, env.latest_checkpoint) as load_path:
+
+                # Horovod distributed training is done inside subprocesses.
+                if hvd_config.use:
+                    subproc = layers.SubprocessLauncher(
+                        env, workloads, load_path, socket_mgr.get_rendezvous_info(), hvd_config
+                    )
+                    subproc.run()
+                else:
+                    if env.experiment_config.debug_enabled():
+                        faulthandler.dump_traceback_later(30, repeat=True)
+
+                    with det._catch_sys_exit():
+                        with det._catch_init_invalid_hp(workloads):
+                            controller = load.prepare_controller(
+                                env,
+                                workloads,
+                                load_path,
+                                socket_mgr.get_rendezvous_info(),
+                                hvd_config,
+                            )
+                        controller.run()
 
 
 def main() -> None:
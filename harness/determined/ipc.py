@@ -184,22 +184,29 @@ class ZMQBroadcastServer:
                 health_check()
                 continue
 
-            message, message_type = self._recv_one()
-            messages.append(message)
+            # Drain every response which has already arrived before polling again, so that a gather
+            # from many workers does not cost one poll per worker.
+            while len(messages) < self._num_connections:
+                try:
+                    message, message_type = self._recv_one(zmq.NOBLOCK)
+                except zmq.Again:
+                    break
 
-            if message_type is _ExceptionMessage:
-                return messages, True
+                messages.append(message)
+
+                if message_type is _ExceptionMessage:
+                    return messages, True
 
         self._recv_serial += 1
 
         return messages, False
 
-    def _recv_one(self) -> Tuple[Any, type]:
+    def _recv_one(self, flags: int = 0) -> Tuple[Any, type]:
         """
         Receive one _SerialMessage from the socket and confirm that it is in-order.
         """
 
-        obj = self._pull_socket.recv_pyobj()
+        obj = self._pull_socket.recv_pyobj(flags)
 
         if isinstance(obj, _ExceptionMessage):
             return None, _ExceptionMessage
@@ -2,7 +2,6 @@ import threading
 import time
 from typing import Any, Dict, List, Tuple
 
-import matplotlib.pyplot as plt
 import psutil
 import simplejson
 
@@ -164,6 +163,10 @@ class HarnessProfiler(object):
             simplejson.dump(self.results(), f)
 
     def serialize_graph(self, path: str, figsize: Tuple[int, int] = (20, 40)) -> None:
+        # Importing pyplot is slow, and every worker process imports determined.layers, but only
+        # the harness ever draws a graph.
+        import matplotlib.pyplot as plt
+
         results = self.results()
 
         plt.figure(figsize=figsize)
@@ -66,15 +66,16 @@ class SubprocessReceiver(workload.Source):
         self._broadcast_client.safe_start()
 
     def __iter__(self) -> workload.Stream:
+        # Every response goes straight back over the broadcast client, so there is no need to
+        # build a new response closure for each workload.
+        respond = self._broadcast_client.send
+
         while True:
             obj = self._broadcast_client.recv()
 
             wkld, args = cast(Tuple[workload.Workload, List[Any]], obj)
 
-            def _respond(message: Any) -> None:
-                self._broadcast_client.send(message)
-
-            yield wkld, args, _respond
+            yield wkld, args, respond
 
 
 class SubprocessLauncher:
@@ -302,7 +303,9 @@ class SubprocessLauncher:
                 raise det.errors.WorkerError("Detected that worker process died.")
 
     def _send_recv_workload(self, wkld: workload.Workload, args: List[Any]) -> workload.Response:
-        # Broadcast every workload to every worker on this machine.
+        # Broadcast every workload to every worker on this machine. Workloads are not coalesced into
+        # larger frames because the master only sends the next workload after it has received the
+        # response to this one, so there is never more than one workload available to send.
         self.broadcast_server.broadcast((wkld, args))
 
         if wkld.kind == workload.Workload.Kind.TERMINATE:
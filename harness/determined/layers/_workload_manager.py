@@ -1,11 +1,12 @@
 import logging
 import math
 import pathlib
+import time
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, cast
 
 import determined as det
-from determined import tensorboard, workload
+from determined import constants, tensorboard, workload
 from determined.common import storage
 from determined.common.check import (
     check_eq,
@@ -21,6 +22,36 @@ def _current_timestamp() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _workload_completed(
+    wkld: workload.Workload,
+    start_time: datetime,
+    metrics: Any,
+    exited_reason: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Returns the WORKLOAD_COMPLETED message reported to the master for a finished workload."""
+    message = {
+        "type": "WORKLOAD_COMPLETED",
+        "workload": wkld,
+        "start_time": start_time,
+        "end_time": _current_timestamp(),
+        "metrics": metrics,
+    }
+    if exited_reason is not None:
+        message["exited_reason"] = exited_reason
+    return message
+
+
+def _exited_reason(in_response: Dict[str, Any]) -> Optional[str]:
+    """Returns the exited_reason implied by the flags of a chief's metrics response, if any."""
+    if in_response.get("invalid_hp", False):
+        return "INVALID_HP"
+    if in_response.get("init_invalid_hp", False):
+        return "INIT_INVALID_HP"
+    if in_response.get("stop_requested", False):
+        return "USER_CANCELED"
+    return None
+
+
 class WorkloadManager(workload.Source):
     """
     WorkloadManager handles workload messages after they are received on the
@@ -43,6 +74,15 @@ class WorkloadManager(workload.Source):
         self.tensorboard_mgr = tensorboard_mgr
         self.callbacks = [metric_writer]  # type: List[det.callback.Callback]
 
+    def __enter__(self) -> "WorkloadManager":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        pass
+
 
 def build_workload_manager(
     env: det.EnvContext,
@@ -82,6 +122,15 @@ class _TrialWorkloadManager(WorkloadManager):
         )
         self.workload = None  # type: Optional[workload.Workload]
 
+        # The searcher metric is fixed for the life of the trial, so only look it up once.
+        searcher_config = env.experiment_config.get("searcher", {})
+        self.searcher_metric = searcher_config.get("metric")  # type: Optional[str]
+
+        # Uploads of tensorboard files written by training steps are throttled; see
+        # _maybe_sync_tensorboard().
+        self._last_tensorboard_sync = None  # type: Optional[float]
+        self._tensorboard_sync_pending = False
+
     def __iter__(self) -> workload.Stream:
         for w, _, response_func in self.workloads:
             if self.rendezvous_info.get_rank() == 0:
@@ -92,17 +141,48 @@ class _TrialWorkloadManager(WorkloadManager):
 
             self.workload = w
 
+            # Workloads are yielded directly from this loop rather than through a sub-generator
+            # per workload. Only checkpoints need a generator, since they must be yielded from
+            # inside of the storage manager's store_path() context.
             if w.kind == workload.Workload.Kind.RUN_STEP:
-                yield from self.yield_train_for_step(w, response_func)
+                yield w, [], self.prepare_train_for_step(w, response_func)
             elif w.kind == workload.Workload.Kind.COMPUTE_VALIDATION_METRICS:
-                yield from self.yield_compute_validation_metrics(w, response_func)
+                yield w, [], self.prepare_compute_validation_metrics(w, response_func)
             elif w.kind == workload.Workload.Kind.CHECKPOINT_MODEL:
                 yield from self.yield_checkpoint_model(w, response_func)
             elif w.kind == workload.Workload.Kind.TERMINATE:
-                yield from self.yield_terminate(w, response_func)
+                yield w, [], self.prepare_terminate(w, response_func)
             else:
                 raise AssertionError("Unexpected workload: {}".format(w.kind))
 
+    def close(self) -> None:
+        # Training step uploads are throttled, so upload anything still pending once the trial
+        # stops, whether it finished or failed.
+        if self._tensorboard_sync_pending:
+            self._sync_tensorboard()
+
+    def _sync_tensorboard(self) -> None:
+        self.tensorboard_mgr.sync()
+        self._last_tensorboard_sync = time.monotonic()
+        self._tensorboard_sync_pending = False
+
+    def _maybe_sync_tensorboard(self) -> None:
+        """
+        Upload tensorboard files after a training step, unless the previous upload was recent.
+
+        Syncing costs at least one round-trip to checkpoint storage, which is expensive to pay after
+        every training step when steps are short. Every sync uploads all files modified since the
+        previous one, and validation, checkpoint, and terminate workloads always sync. A pending
+        upload is also done by close(), which runs when the trial stops, even if it fails. Only a
+        process that is killed outright can lose up to one period of training step files.
+        """
+        if self._last_tensorboard_sync is not None:
+            since_last_sync = time.monotonic() - self._last_tensorboard_sync
+            if since_last_sync < constants.TRAINING_TENSORBOARD_SYNC_PERIOD_SECONDS:
+                self._tensorboard_sync_pending = True
+                return
+        self._sync_tensorboard()
+
     def check_sane_workload(self, new_workload: workload.Workload) -> None:
         # If this is the initial workload, we don't expect to start with
         # a checkpoint operation. All other workloads are reasonable.
@@ -119,9 +199,10 @@ class _TrialWorkloadManager(WorkloadManager):
         else:
             check_eq(self.workload.step_id, new_workload.step_id)
 
-    def yield_train_for_step(
+    def prepare_train_for_step(
         self, wkld: workload.Workload, respond: workload.ResponseFunc
-    ) -> workload.Stream:
+    ) -> workload.ResponseFunc:
+        """Run the hooks for the start of a training step and return its response function."""
         start_time = _current_timestamp()
 
         for callback in self.callbacks:
@@ -140,32 +221,12 @@ class _TrialWorkloadManager(WorkloadManager):
             check_not_isinstance(in_response, workload.Skipped, "Chief skipped a workload.")
 
             in_response = cast(workload.Metrics, in_response)
-            metrics = in_response["metrics"]
-
-            metrics = cast(workload.Metrics, metrics)
-
-            if in_response.get("invalid_hp", False):
-                out_response = {
-                    "type": "WORKLOAD_COMPLETED",
-                    "workload": wkld,
-                    "start_time": start_time,
-                    "end_time": _current_timestamp(),
-                    "metrics": metrics,
-                }
-                out_response["exited_reason"] = "INVALID_HP"
-                respond(out_response)
-                return
+            metrics = cast(workload.Metrics, in_response["metrics"])
+            exited_reason = _exited_reason(in_response)
 
-            if in_response.get("init_invalid_hp", False):
-                out_response = {
-                    "type": "WORKLOAD_COMPLETED",
-                    "workload": wkld,
-                    "start_time": start_time,
-                    "end_time": _current_timestamp(),
-                    "metrics": metrics,
-                }
-                out_response["exited_reason"] = "INIT_INVALID_HP"
-                respond(out_response)
+            # Invalid hyperparameters skip all metrics processing.
+            if exited_reason in ("INVALID_HP", "INIT_INVALID_HP"):
+                respond(_workload_completed(wkld, start_time, metrics, exited_reason))
                 return
 
             batch_metrics = metrics["batch_metrics"]
@@ -179,27 +240,17 @@ class _TrialWorkloadManager(WorkloadManager):
                     wkld.step_id, wkld.num_batches, wkld.total_batches_processed, metrics
                 )
 
-            self.tensorboard_mgr.sync()
-
-            out_response = {
-                "type": "WORKLOAD_COMPLETED",
-                "workload": wkld,
-                "start_time": start_time,
-                "end_time": _current_timestamp(),
-                "metrics": metrics,
-            }
-
-            if in_response.get("stop_requested", False):
-                out_response["exited_reason"] = "USER_CANCELED"
+            self._maybe_sync_tensorboard()
 
             # Send the response up.
-            respond(out_response)
+            respond(_workload_completed(wkld, start_time, metrics, exited_reason))
 
-        yield wkld, [], _respond
+        return _respond
 
-    def yield_compute_validation_metrics(
+    def prepare_compute_validation_metrics(
         self, wkld: workload.Workload, respond: workload.ResponseFunc
-    ) -> workload.Stream:
+    ) -> workload.ResponseFunc:
+        """Run the hooks for the start of a validation and return its response function."""
         start_time = _current_timestamp()
 
         def _respond(in_response: workload.Response) -> None:
@@ -211,31 +262,12 @@ class _TrialWorkloadManager(WorkloadManager):
 
             check_not_isinstance(in_response, workload.Skipped, "Chief skipped a workload.")
             in_response = cast(Dict[str, Any], in_response)
-            metrics = in_response["metrics"]
-            metrics = cast(workload.Metrics, metrics)
-
-            if in_response.get("invalid_hp", False):
-                out_response = {
-                    "type": "WORKLOAD_COMPLETED",
-                    "workload": wkld,
-                    "start_time": start_time,
-                    "end_time": _current_timestamp(),
-                    "metrics": metrics,
-                }
-                out_response["exited_reason"] = "INVALID_HP"
-                respond(out_response)
-                return
+            metrics = cast(workload.Metrics, in_response["metrics"])
+            exited_reason = _exited_reason(in_response)
 
-            if in_response.get("init_invalid_hp", False):
-                out_response = {
-                    "type": "WORKLOAD_COMPLETED",
-                    "workload": wkld,
-                    "start_time": start_time,
-                    "end_time": _current_timestamp(),
-                    "metrics": metrics,
-                }
-                out_response["exited_reason"] = "INIT_INVALID_HP"
-                respond(out_response)
+            # Invalid hyperparameters skip all metrics processing.
+            if exited_reason in ("INVALID_HP", "INIT_INVALID_HP"):
+                respond(_workload_completed(wkld, start_time, metrics, exited_reason))
                 return
 
             v_metrics = metrics["validation_metrics"]
@@ -244,79 +276,73 @@ class _TrialWorkloadManager(WorkloadManager):
                     wkld.step_id, wkld.total_batches_processed, v_metrics
                 )
 
-            self.tensorboard_mgr.sync()
-
-            # Check that the validation metrics computed by the model code
-            # includes the metric used by the search method.
-            searcher_metric = self.env.experiment_config["searcher"]["metric"]
-            if searcher_metric not in v_metrics:
-                raise AssertionError(
-                    "Search method is configured to use metric '{}' but model "
-                    "definition returned validation metrics {}. The metric "
-                    "used by the search method must be one of the validation "
-                    "metrics returned by the model definition.".format(
-                        searcher_metric, list(v_metrics.keys())
+            try:
+                # Check that the validation metrics computed by the model code
+                # includes the metric used by the search method.
+                searcher_metric = self.searcher_metric
+                if searcher_metric not in v_metrics:
+                    raise AssertionError(
+                        "Search method is configured to use metric '{}' but model "
+                        "definition returned validation metrics {}. The metric "
+                        "used by the search method must be one of the validation "
+                        "metrics returned by the model definition.".format(
+                            searcher_metric, list(v_metrics.keys())
+                        )
                     )
-                )
-
-            # Check that the searcher metric has a scalar value so that it can be compared for
-            # search purposes. Other metrics don't have to be scalars.
-            metric_value = v_metrics[searcher_metric]
-            if not tensorboard.metric_writers.util.is_numerical_scalar(metric_value):
-                raise AssertionError(
-                    "Searcher validation metric '{}' returned "
-                    "a non-scalar value: {}".format(searcher_metric, metric_value)
-                )
 
-            non_serializable_metrics = set()
-            # NaN and bytes are not JSON serializable. None does not have a
-            # canonical JSON representation. In the case of trial implementation bugs
-            # or numerical instability issues, validation metric functions may
-            # return None or NaN values. For now, immediately fail any trial that
-            # encounters such a None metric. For NaN metrics, if it's the target of
-            # the searcher, we set it to +/- max_float depending on if the searcher
-            # is optimizing for the max or min. NaN metrics which are not the
-            # target of the searcher are dropped.
-            # TODO (DET-2495): Do not replace NaN metric values.
-            for metric_name, metric_value in v_metrics.items():
-                metric_is_none = metric_value is None
-                metric_is_nan = tensorboard.metric_writers.util.is_numerical_scalar(
-                    metric_value
-                ) and math.isnan(metric_value)
-
-                if metric_is_none or metric_is_nan:
+                # Check that the searcher metric has a scalar value so that it can be compared for
+                # search purposes. Other metrics don't have to be scalars.
+                metric_value = v_metrics[searcher_metric]
+                if not tensorboard.metric_writers.util.is_numerical_scalar(metric_value):
                     raise AssertionError(
-                        "Validation metric '{}' returned "
-                        "an invalid scalar value: {}".format(metric_name, metric_value)
+                        "Searcher validation metric '{}' returned "
+                        "a non-scalar value: {}".format(searcher_metric, metric_value)
                     )
 
-                if isinstance(metric_value, (bytes, bytearray)):
-                    non_serializable_metrics.add(metric_name)
-
-            if len(non_serializable_metrics):
-                logging.warning(
-                    "Removed non serializable metrics: %s", ", ".join(non_serializable_metrics)
-                )
-                for metric_name in non_serializable_metrics:
-                    del v_metrics[metric_name]
-
-            out_response = {
-                "type": "WORKLOAD_COMPLETED",
-                "workload": wkld,
-                "start_time": start_time,
-                "end_time": _current_timestamp(),
-                "metrics": metrics,
-            }
-
-            if in_response.get("stop_requested", False):
-                out_response["exited_reason"] = "USER_CANCELED"
+                non_serializable_metrics = set()
+                # NaN and bytes are not JSON serializable. None does not have a
+                # canonical JSON representation. In the case of trial implementation bugs
+                # or numerical instability issues, validation metric functions may
+                # return None or NaN values. For now, immediately fail any trial that
+                # encounters such a None metric. For NaN metrics, if it's the target of
+                # the searcher, we set it to +/- max_float depending on if the searcher
+                # is optimizing for the max or min. NaN metrics which are not the
+                # target of the searcher are dropped.
+                # TODO (DET-2495): Do not replace NaN metric values.
+                for metric_name, metric_value in v_metrics.items():
+                    metric_is_none = metric_value is None
+                    metric_is_nan = tensorboard.metric_writers.util.is_numerical_scalar(
+                        metric_value
+                    ) and math.isnan(metric_value)
+
+                    if metric_is_none or metric_is_nan:
+                        raise AssertionError(
+                            "Validation metric '{}' returned "
+                            "an invalid scalar value: {}".format(metric_name, metric_value)
+                        )
+
+                    if isinstance(metric_value, (bytes, bytearray)):
+                        non_serializable_metrics.add(metric_name)
+
+                if len(non_serializable_metrics):
+                    logging.warning(
+                        "Removed non serializable metrics: %s", ", ".join(non_serializable_metrics)
+                    )
+                    for metric_name in non_serializable_metrics:
+                        del v_metrics[metric_name]
 
-            respond(out_response)
+                respond(_workload_completed(wkld, start_time, metrics, exited_reason))
+            finally:
+                # Upload tensorboard files only after reporting the validation, so that the master
+                # can update the searcher and persist the metrics while the upload is in progress.
+                # Still upload them if the checks above fail the trial, since that is when the
+                # files the callbacks just wrote are most useful.
+                self._sync_tensorboard()
 
         for callback in self.callbacks:
             callback.on_validation_step_begin(wkld.step_id, wkld.total_batches_processed)
 
-        yield wkld, [], _respond
+        return _respond
 
     def yield_checkpoint_model(
         self, wkld: workload.Workload, respond: workload.ResponseFunc
@@ -341,16 +367,10 @@ class _TrialWorkloadManager(WorkloadManager):
             )
 
             logging.info("Saved trial to checkpoint {}".format(metadata.storage_id))
-            self.tensorboard_mgr.sync()
+            self._sync_tensorboard()
 
             nonlocal message
-            message = {
-                "type": "WORKLOAD_COMPLETED",
-                "workload": wkld,
-                "start_time": start_time,
-                "end_time": _current_timestamp(),
-                "metrics": metadata,
-            }
+            message = _workload_completed(wkld, start_time, metadata)
 
         with self.storage_mgr.store_path() as (storage_id, path):
             yield wkld, [pathlib.Path(path)], _respond
@@ -361,12 +381,15 @@ class _TrialWorkloadManager(WorkloadManager):
 
         respond(message)
 
-    def yield_terminate(
+    def prepare_terminate(
         self, wkld: workload.Workload, respond: workload.ResponseFunc
-    ) -> workload.Stream:
+    ) -> workload.ResponseFunc:
 
         # The master can't actually handle WORKLOAD_COMPLETED messages for TERMINATE workloads.
         def _respond(_: workload.Response) -> None:
+            # Upload any tensorboard files from training steps that have not been synced yet.
+            if self._tensorboard_sync_pending:
+                self._sync_tensorboard()
             respond(workload.Skipped())
 
-        yield wkld, [], _respond
+        return _respond
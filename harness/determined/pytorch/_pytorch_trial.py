@@ -212,7 +212,9 @@ class PyTorchTrialController(det.LoopTrialController):
                 raise AssertionError("Unexpected workload: {}".format(w.kind))
 
     def get_epoch_idx(self, batch_id: int) -> int:
-        return batch_id // len(self.training_loader)
+        # The epoch length is computed once in _set_data_loaders(); recomputing len() on the
+        # wrapped batch samplers for every batch is needlessly expensive.
+        return batch_id // cast(int, self.context._epoch_len)
 
     def _average_training_metrics(
         self, per_batch_metrics: List[Dict[str, Any]]
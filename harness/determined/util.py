@@ -90,11 +90,13 @@ def _dict_to_list(dict_of_lists: Dict[str, List]) -> List[Dict[str, Any]]:
 
 
 def validate_batch_metrics(batch_metrics: List[Dict[str, Any]]) -> None:
-    metric_dict = _list_to_dict(batch_metrics)
+    if not batch_metrics:
+        return
 
-    # We expect that all batches have the same set of metrics.
-    metric_dict_keys = metric_dict.keys()
-    for idx, metric_dict in zip(range(len(batch_metrics)), batch_metrics):
+    # We expect that all batches have the same set of metrics. This runs on every training step,
+    # so compare each batch's keys against the first batch rather than transposing all values.
+    metric_dict_keys = batch_metrics[0].keys()
+    for idx, metric_dict in enumerate(batch_metrics):
         keys = metric_dict.keys()
         if metric_dict_keys == keys:
             continue
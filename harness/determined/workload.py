@@ -14,6 +14,17 @@ class Workload:
         CHECKPOINT_MODEL = 3
         TERMINATE = 4
 
+    # A Workload is created for every message from the master and serialized into every response,
+    # so avoid giving each one its own __dict__.
+    __slots__ = (
+        "kind",
+        "experiment_id",
+        "trial_id",
+        "step_id",
+        "num_batches",
+        "total_batches_processed",
+    )
+
     def __init__(
         self,
         kind: Kind,
@@ -34,7 +45,7 @@ class Workload:
         if type(self) is not type(other):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
 
     def __hash__(self) -> int:
         return hash((self.kind, self.experiment_id, self.trial_id, self.step_id))
@@ -43,8 +54,23 @@ class Workload:
         extra = f" ({self.num_batches} Batches)" if self.kind == self.Kind.RUN_STEP else ""
         return f"<{self.kind.name}{extra}: ({self.experiment_id},{self.trial_id},{self.step_id})>"
 
+    def __reduce__(self) -> Tuple[Callable[..., "Workload"], Tuple[Any, ...]]:
+        # Workloads are pickled for every broadcast to the worker processes. Pickle the kind by
+        # value, rather than as a reference to the Kind enum, to keep those messages small.
+        return (
+            _unpickle_workload,
+            (
+                self.kind.value,
+                self.experiment_id,
+                self.trial_id,
+                self.step_id,
+                self.num_batches,
+                self.total_batches_processed,
+            ),
+        )
+
     def __json__(self) -> Dict[str, Any]:
-        return self.__dict__
+        return {name: getattr(self, name) for name in self.__slots__}
 
     @staticmethod
     def from_json(dict: Dict[str, Any]) -> "Workload":
@@ -59,6 +85,17 @@ class Workload:
         )
 
 
+def _unpickle_workload(
+    kind: int,
+    e_id: ExperimentID,
+    t_id: TrialID,
+    s_id: StepID,
+    num_batches: int,
+    total_batches_processed: int,
+) -> Workload:
+    return Workload(Workload.Kind(kind), e_id, t_id, s_id, num_batches, total_batches_processed)
+
+
 """Metrics is the general structure of metrics used in response messages throughout the harness."""
 Metrics = Dict[str, Any]
 
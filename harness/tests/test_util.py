@@ -1,5 +1,8 @@
+import pytest
+
+from determined.common import check
 from determined.common.util import sizeof_fmt
-from determined.util import _dict_to_list, _list_to_dict
+from determined.util import _dict_to_list, _list_to_dict, validate_batch_metrics
 
 
 def test_list_to_dict() -> None:
@@ -12,6 +15,17 @@ def test_dict_to_list() -> None:
     assert r == [{"a": 1, "b": 3}, {"a": 2, "b": 4}]
 
 
+def test_validate_batch_metrics() -> None:
+    validate_batch_metrics([])
+    validate_batch_metrics([{"a": 1, "b": 2}, {"b": 3, "a": 4}])
+
+    with pytest.raises(check.CheckFailedError, match="index: 1"):
+        validate_batch_metrics([{"a": 1}, {"a": 2, "b": 3}])
+
+    with pytest.raises(check.CheckFailedError, match="index: 2"):
+        validate_batch_metrics([{"a": 1}, {"a": 2}, {"b": 3}])
+
+
 def test_sizeof_fmt() -> None:
     assert sizeof_fmt(1024) == "1.0KB"
     assert sizeof_fmt(36) == "36.0B"
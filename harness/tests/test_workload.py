@@ -0,0 +1,17 @@
+import pickle
+
+from determined import workload
+
+
+def test_workload_pickle_round_trip() -> None:
+    workloads = [
+        workload.train_workload(1, num_batches=100, total_batches_processed=300),
+        workload.validation_workload(2),
+        workload.checkpoint_workload(3),
+        workload.terminate_workload(4),
+    ]
+    for wkld in workloads:
+        restored = pickle.loads(pickle.dumps(wkld))
+        assert restored == wkld
+        assert restored.kind is wkld.kind
+        assert restored.total_batches_processed == wkld.total_batches_processed
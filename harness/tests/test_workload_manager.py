@@ -1,13 +1,15 @@
 import contextlib
 import os
 import pathlib
-from typing import Any, Dict, Iterator, Optional, cast
+import time
+from typing import Any, Dict, Iterator, List, Optional, cast
 
 import numpy as np
 import pytest
+from _pytest import monkeypatch
 
 import determined as det
-from determined import layers, tensorboard, workload
+from determined import constants, layers, tensorboard, workload
 from determined.common import check, storage
 from tests.experiment import utils
 
@@ -87,7 +89,8 @@ class NoopTrialController(det.TrialController):
                     f.write("yup")
                 response_func({})
             elif w.kind == workload.Workload.Kind.TERMINATE:
-                raise NotImplementedError()
+                response_func({})
+                break
 
 
 def test_checkpoint_upload_failure(tmp_path: pathlib.Path) -> None:
@@ -165,3 +168,273 @@ def test_reject_nonscalar_searcher_metric() -> None:
         else:
             with pytest.raises(AssertionError, match="non-scalar"):
                 trial_controller.run()
+
+
+class CountingTensorboardManager(NoopTensorboardManager):
+    def __init__(self) -> None:
+        self.sync_count = 0
+
+    def sync(self) -> None:
+        self.sync_count += 1
+
+
+def test_training_tensorboard_sync_is_throttled() -> None:
+    metric_name = "validation_error"
+
+    hparams = {"global_batch_size": 64}
+    experiment_config = utils.make_default_exp_config(hparams, 1)
+    experiment_config["searcher"] = {"metric": metric_name}
+    env = utils.make_default_env_context(hparams=hparams, experiment_config=experiment_config)
+    rendezvous_info = utils.make_default_rendezvous_info()
+    storage_manager = NoopStorageManager(os.devnull)
+    tensorboard_manager = CountingTensorboardManager()
+    metric_writer = NoopBatchMetricWriter()
+
+    def make_workloads() -> workload.Stream:
+        for step_id in range(1, 4):
+            yield workload.train_workload(step_id), [], workload.ignore_workload_response
+            # Only the first training step should have uploaded tensorboard files.
+            assert tensorboard_manager.sync_count == 1
+        yield workload.validation_workload(3), [], workload.ignore_workload_response
+        # Validations always upload tensorboard files.
+        assert tensorboard_manager.sync_count == 2
+
+    workload_manager = layers.build_workload_manager(
+        env,
+        make_workloads(),
+        rendezvous_info,
+        storage_manager,
+        tensorboard_manager,
+        metric_writer,
+    )
+
+    trial_controller = NoopTrialController(
+        iter(workload_manager), validation_metrics={metric_name: 0.17}
+    )
+    trial_controller.run()
+    assert tensorboard_manager.sync_count == 2
+
+
+def test_training_tensorboard_sync_resumes_after_period(
+    monkeypatch: monkeypatch.MonkeyPatch,
+) -> None:
+    hparams = {"global_batch_size": 64}
+    env = utils.make_default_env_context(hparams)
+    rendezvous_info = utils.make_default_rendezvous_info()
+    storage_manager = NoopStorageManager(os.devnull)
+    tensorboard_manager = CountingTensorboardManager()
+    metric_writer = NoopBatchMetricWriter()
+
+    now = 1000.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+
+    def make_workloads() -> workload.Stream:
+        nonlocal now
+        yield workload.train_workload(1), [], workload.ignore_workload_response
+        assert tensorboard_manager.sync_count == 1
+
+        now += constants.TRAINING_TENSORBOARD_SYNC_PERIOD_SECONDS - 1
+        yield workload.train_workload(2), [], workload.ignore_workload_response
+        assert tensorboard_manager.sync_count == 1
+
+        now += 1
+        yield workload.train_workload(3), [], workload.ignore_workload_response
+        assert tensorboard_manager.sync_count == 2
+
+    workload_manager = layers.build_workload_manager(
+        env,
+        make_workloads(),
+        rendezvous_info,
+        storage_manager,
+        tensorboard_manager,
+        metric_writer,
+    )
+
+    NoopTrialController(iter(workload_manager)).run()
+    assert tensorboard_manager.sync_count == 2
+
+
+def test_pending_tensorboard_sync_runs_on_terminate() -> None:
+    hparams = {"global_batch_size": 64}
+    env = utils.make_default_env_context(hparams)
+    rendezvous_info = utils.make_default_rendezvous_info()
+    storage_manager = NoopStorageManager(os.devnull)
+    tensorboard_manager = CountingTensorboardManager()
+    metric_writer = NoopBatchMetricWriter()
+
+    def make_workloads() -> workload.Stream:
+        yield workload.train_workload(1), [], workload.ignore_workload_response
+        yield workload.train_workload(2), [], workload.ignore_workload_response
+        # The second training step's upload was throttled.
+        assert tensorboard_manager.sync_count == 1
+        yield workload.terminate_workload(2), [], workload.ignore_workload_response
+        assert tensorboard_manager.sync_count == 2
+
+    workload_manager = layers.build_workload_manager(
+        env,
+        make_workloads(),
+        rendezvous_info,
+        storage_manager,
+        tensorboard_manager,
+        metric_writer,
+    )
+
+    trial_controller = NoopTrialController(iter(workload_manager))
+    trial_controller.run()
+    assert tensorboard_manager.sync_count == 2
+
+
+def test_pending_tensorboard_sync_runs_on_stream_failure() -> None:
+    hparams = {"global_batch_size": 64}
+    env = utils.make_default_env_context(hparams)
+    rendezvous_info = utils.make_default_rendezvous_info()
+    storage_manager = NoopStorageManager(os.devnull)
+    tensorboard_manager = CountingTensorboardManager()
+    metric_writer = NoopBatchMetricWriter()
+
+    def make_workloads() -> workload.Stream:
+        yield workload.train_workload(1), [], workload.ignore_workload_response
+        yield workload.train_workload(2), [], workload.ignore_workload_response
+        assert tensorboard_manager.sync_count == 1
+        raise ValueError("master connection lost")
+
+    workload_manager = layers.build_workload_manager(
+        env,
+        make_workloads(),
+        rendezvous_info,
+        storage_manager,
+        tensorboard_manager,
+        metric_writer,
+    )
+
+    with pytest.raises(ValueError, match="master connection lost"):
+        with workload_manager:
+            NoopTrialController(iter(workload_manager)).run()
+
+    # The throttled upload from the second training step still happened.
+    assert tensorboard_manager.sync_count == 2
+
+
+class FailingTrialController(NoopTrialController):
+    """Completes training steps like NoopTrialController, but fails on any other workload."""
+
+    def run(self) -> None:
+        for w, _, response_func in self.workloads:
+            if w.kind != workload.Workload.Kind.RUN_STEP:
+                raise ValueError("trial failed")
+            metrics = det.util.make_metrics(
+                num_inputs=None,
+                batch_metrics=[{"loss": 1} for _ in range(w.num_batches)],
+            )
+            response_func({"metrics": metrics})
+
+
+def test_pending_tensorboard_sync_runs_on_trial_failure() -> None:
+    hparams = {"global_batch_size": 64}
+    env = utils.make_default_env_context(hparams)
+    rendezvous_info = utils.make_default_rendezvous_info()
+    storage_manager = NoopStorageManager(os.devnull)
+    tensorboard_manager = CountingTensorboardManager()
+    metric_writer = NoopBatchMetricWriter()
+
+    def make_workloads() -> workload.Stream:
+        yield workload.train_workload(1), [], workload.ignore_workload_response
+        yield workload.train_workload(2), [], workload.ignore_workload_response
+        assert tensorboard_manager.sync_count == 1
+        yield workload.validation_workload(2), [], workload.ignore_workload_response
+
+    workload_manager = layers.build_workload_manager(
+        env,
+        make_workloads(),
+        rendezvous_info,
+        storage_manager,
+        tensorboard_manager,
+        metric_writer,
+    )
+
+    # The trial raises from its own frame, so the exception never passes through the workload
+    # manager's generator, which is left suspended.
+    with pytest.raises(ValueError, match="trial failed"):
+        with workload_manager:
+            FailingTrialController(iter(workload_manager)).run()
+
+    # Closing the workload manager did the throttled upload from the second training step.
+    assert tensorboard_manager.sync_count == 2
+
+
+@pytest.mark.parametrize(
+    "validation_metrics,error",
+    [({"loss": 0.17}, "Search method is configured"), ({"validation_error": "foo"}, "non-scalar")],
+)
+def test_failed_validation_still_syncs_tensorboard(
+    validation_metrics: Dict[str, Any], error: str
+) -> None:
+    hparams = {"global_batch_size": 64}
+    experiment_config = utils.make_default_exp_config(hparams, 1)
+    experiment_config["searcher"] = {"metric": "validation_error"}
+    env = utils.make_default_env_context(hparams=hparams, experiment_config=experiment_config)
+    rendezvous_info = utils.make_default_rendezvous_info()
+    storage_manager = NoopStorageManager(os.devnull)
+    tensorboard_manager = CountingTensorboardManager()
+    metric_writer = NoopBatchMetricWriter()
+
+    def make_workloads() -> workload.Stream:
+        yield workload.validation_workload(1), [], workload.ignore_workload_response
+
+    workload_manager = layers.build_workload_manager(
+        env,
+        make_workloads(),
+        rendezvous_info,
+        storage_manager,
+        tensorboard_manager,
+        metric_writer,
+    )
+
+    trial_controller = NoopTrialController(
+        iter(workload_manager), validation_metrics=validation_metrics
+    )
+    with pytest.raises(AssertionError, match=error):
+        trial_controller.run()
+
+    # The tensorboard files written for the failed validation were uploaded anyway.
+    assert tensorboard_manager.sync_count == 1
+
+
+def test_validation_responds_before_tensorboard_sync() -> None:
+    metric_name = "validation_error"
+
+    hparams = {"global_batch_size": 64}
+    experiment_config = utils.make_default_exp_config(hparams, 1)
+    experiment_config["searcher"] = {"metric": metric_name}
+    env = utils.make_default_env_context(hparams=hparams, experiment_config=experiment_config)
+    rendezvous_info = utils.make_default_rendezvous_info()
+    storage_manager = NoopStorageManager(os.devnull)
+    tensorboard_manager = CountingTensorboardManager()
+    metric_writer = NoopBatchMetricWriter()
+
+    sync_counts_at_response = []  # type: List[int]
+
+    def validation_response_func(metrics: workload.Response) -> None:
+        sync_counts_at_response.append(tensorboard_manager.sync_count)
+
+    def make_workloads() -> workload.Stream:
+        yield workload.train_workload(1), [], workload.ignore_workload_response
+        yield workload.validation_workload(1), [], validation_response_func
+
+    workload_manager = layers.build_workload_manager(
+        env,
+        make_workloads(),
+        rendezvous_info,
+        storage_manager,
+        tensorboard_manager,
+        metric_writer,
+    )
+
+    trial_controller = NoopTrialController(
+        iter(workload_manager), validation_metrics={metric_name: 0.17}
+    )
+    trial_controller.run()
+
+    # The validation was reported before its tensorboard files were uploaded.
+    assert sync_counts_at_response == [1]
+    assert tensorboard_manager.sync_count == 2
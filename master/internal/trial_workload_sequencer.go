@@ -46,6 +46,9 @@ type (
 		trialIDValid bool
 
 		ops []searcher.ValidateAfter
+		// The length of each operation in ops converted to batches, so that Workload() does not
+		// convert the current operation's length every time it is called.
+		opBatches []int
 
 		expID  int
 		create searcher.Create
@@ -56,6 +59,11 @@ type (
 
 		unitContext model.UnitContext
 
+		// The minimum validation and checkpoint periods converted to batches, which are fixed for
+		// the life of the sequencer. They are zero when the corresponding period is disabled.
+		minValidationPeriodBatches int
+		minCheckpointPeriodBatches int
+
 		schedulingUnit int
 	}
 )
@@ -71,7 +79,7 @@ func newTrialWorkloadSequencer(
 	create searcher.Create,
 	firstCheckpoint *model.Checkpoint,
 ) *trialWorkloadSequencer {
-	return &trialWorkloadSequencer{
+	s := &trialWorkloadSequencer{
 		trialWorkloadSequencerState: trialWorkloadSequencerState{
 			NeedInitialValidation: config.PerformInitialValidation(),
 			LatestCheckpoint:      firstCheckpoint,
@@ -89,6 +97,17 @@ func newTrialWorkloadSequencer(
 		create:         create,
 		expID:          expID,
 	}
+	s.minValidationPeriodBatches = periodInBatches(s.unitContext, s.minValidationPeriod)
+	s.minCheckpointPeriodBatches = periodInBatches(s.unitContext, s.minCheckpointPeriod)
+	return s
+}
+
+// periodInBatches converts a configured period to batches, leaving a disabled period as zero.
+func periodInBatches(unitContext model.UnitContext, period expconf.Length) int {
+	if period.Units == 0 {
+		return 0
+	}
+	return unitContext.ToNearestBatch(period)
 }
 
 func (s *trialWorkloadSequencer) Snapshot() (json.RawMessage, error) {
@@ -106,6 +125,7 @@ func (s *trialWorkloadSequencer) WorkloadManagerType() model.WorkloadManagerType
 // OperationRequested records an operation requested by the searcher.
 func (s *trialWorkloadSequencer) OperationRequested(op searcher.ValidateAfter) {
 	s.ops = append(s.ops, op)
+	s.opBatches = append(s.opBatches, s.unitContext.ToNearestBatch(op.Length))
 }
 
 func (s *trialWorkloadSequencer) SetTrialID(trialID int) {
@@ -266,7 +286,7 @@ func (s trialWorkloadSequencer) Workload() (workload.Workload, error) {
 		return s.validate(), nil
 	}
 
-	batchesLeft := s.unitContext.ToNearestBatch(s.ops[s.CurOpIdx].Length) - s.TotalBatchesProcessed
+	batchesLeft := s.opBatches[s.CurOpIdx] - s.TotalBatchesProcessed
 	batchesTilVal := s.batchesUntilValNeeded()
 	batchesTilCkpt := s.batchesUntilCkptNeeded()
 	batchesThisStep := max(min(
@@ -369,6 +389,10 @@ func (s *trialWorkloadSequencer) minValidationNeeded() bool {
 	if s.minValidationPeriod.Units == 0 {
 		return false
 	}
+	// Nothing has trained since the last validation, so another one cannot be due yet.
+	if s.BatchesSinceLastVal == 0 {
+		return false
+	}
 	return s.unitContext.EqualWithinBatch(s.minValidationPeriod, s.BatchesSinceLastVal)
 }
 
@@ -376,13 +400,17 @@ func (s *trialWorkloadSequencer) batchesUntilValNeeded() int {
 	if s.minValidationPeriod.Units == 0 {
 		return math.MaxInt32
 	}
-	return s.unitContext.ToNearestBatch(s.minValidationPeriod) - s.BatchesSinceLastVal
+	return s.minValidationPeriodBatches - s.BatchesSinceLastVal
 }
 
 func (s *trialWorkloadSequencer) minCheckpointNeeded() bool {
 	if s.minCheckpointPeriod.Units == 0 {
 		return false
 	}
+	// Nothing has trained since the last checkpoint, so another one cannot be due yet.
+	if s.BatchesSinceLastCkpt == 0 {
+		return false
+	}
 	return s.unitContext.EqualWithinBatch(s.minCheckpointPeriod, s.BatchesSinceLastCkpt)
 }
 
@@ -398,7 +426,7 @@ func (s *trialWorkloadSequencer) batchesUntilCkptNeeded() int {
 	if s.minCheckpointPeriod.Units == 0 {
 		return math.MaxInt32
 	}
-	return s.unitContext.ToNearestBatch(s.minCheckpointPeriod) - s.BatchesSinceLastCkpt
+	return s.minCheckpointPeriodBatches - s.BatchesSinceLastCkpt
 }
 
 func (s *trialWorkloadSequencer) Progress() model.PartialUnits {
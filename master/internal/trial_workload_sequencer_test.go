@@ -397,3 +397,138 @@ func TestTrialWorkloadSequencerOperationLessThanBatchSize(t *testing.T) {
 	assert.Assert(t, completedOp != nil, "expected to report a validation")
 	assert.Equal(t, *completedOp, train, "reported incorrect validation") // nolint:staticcheck
 }
+
+func TestTrialWorkloadSequencerMinValidationPeriodLessThanBatchSize(t *testing.T) {
+	expConfig, err := defaultExperimentConfig()
+	assert.NilError(t, err)
+	expConfig.SetMinValidationPeriod(expconf.NewLengthInRecords(10))
+
+	rand := nprand.New(0)
+	create := searcher.NewCreate(rand, map[string]interface{}{
+		model.GlobalBatchSize: 64,
+	}, model.TrialWorkloadSequencerType)
+
+	s := newTrialWorkloadSequencer(1, expConfig, create, nil)
+	s.SetTrialID(1)
+
+	train := searcher.NewValidateAfter(create.RequestID, expconf.NewLength(expconf.Batches, 500))
+	s.OperationRequested(train)
+
+	trainWorkload1 := workload.Workload{
+		Kind:                  workload.RunStep,
+		ExperimentID:          1,
+		TrialID:               1,
+		StepID:                1,
+		NumBatches:            1,
+		PriorBatchesProcessed: 0,
+	}
+	w, err := s.Workload()
+	assert.NilError(t, err)
+	assert.Equal(t, w, trainWorkload1)
+
+	completedOp, err := s.WorkloadCompleted(workload.CompletedMessage{
+		Workload: trainWorkload1,
+	}, nil)
+	assert.NilError(t, err)
+	assert.Assert(t, completedOp == nil, "should not have finished %v yet", train)
+
+	// A period shorter than one batch is due after every batch.
+	validationWorkload1 := workload.Workload{
+		Kind:                  workload.ComputeValidationMetrics,
+		ExperimentID:          1,
+		TrialID:               1,
+		StepID:                1,
+		PriorBatchesProcessed: 1,
+	}
+	w, err = s.Workload()
+	assert.NilError(t, err)
+	assert.Equal(t, w, validationWorkload1)
+
+	completedOp, err = s.WorkloadCompleted(workload.CompletedMessage{
+		Workload:          validationWorkload1,
+		ValidationMetrics: &workload.ValidationMetrics{},
+	}, func() bool { return false })
+	assert.NilError(t, err)
+	assert.Assert(t, completedOp == nil, "should not have finished %v yet", train)
+
+	// Check that the sequencer trains again, rather than repeating the same validation.
+	w, err = s.Workload()
+	assert.NilError(t, err)
+	assert.Equal(t, w, workload.Workload{
+		Kind:                  workload.RunStep,
+		ExperimentID:          1,
+		TrialID:               1,
+		StepID:                2,
+		NumBatches:            1,
+		PriorBatchesProcessed: 1,
+	})
+}
+
+func TestTrialWorkloadSequencerMinCheckpointPeriodLessThanBatchSize(t *testing.T) {
+	expConfig, err := defaultExperimentConfig()
+	assert.NilError(t, err)
+	expConfig.SetMinCheckpointPeriod(expconf.NewLengthInRecords(10))
+
+	rand := nprand.New(0)
+	create := searcher.NewCreate(rand, map[string]interface{}{
+		model.GlobalBatchSize: 64,
+	}, model.TrialWorkloadSequencerType)
+
+	s := newTrialWorkloadSequencer(1, expConfig, create, nil)
+	s.SetTrialID(1)
+
+	train := searcher.NewValidateAfter(create.RequestID, expconf.NewLength(expconf.Batches, 500))
+	s.OperationRequested(train)
+
+	// Check that the sequencer trains before the first checkpoint, rather than checkpointing an
+	// untrained model.
+	trainWorkload1 := workload.Workload{
+		Kind:                  workload.RunStep,
+		ExperimentID:          1,
+		TrialID:               1,
+		StepID:                1,
+		NumBatches:            1,
+		PriorBatchesProcessed: 0,
+	}
+	w, err := s.Workload()
+	assert.NilError(t, err)
+	assert.Equal(t, w, trainWorkload1)
+
+	completedOp, err := s.WorkloadCompleted(workload.CompletedMessage{
+		Workload: trainWorkload1,
+	}, nil)
+	assert.NilError(t, err)
+	assert.Assert(t, completedOp == nil, "should not have finished %v yet", train)
+
+	// A period shorter than one batch is due after every batch.
+	checkpointWorkload1 := workload.Workload{
+		Kind:                  workload.CheckpointModel,
+		ExperimentID:          1,
+		TrialID:               1,
+		StepID:                1,
+		PriorBatchesProcessed: 1,
+	}
+	w, err = s.Workload()
+	assert.NilError(t, err)
+	assert.Equal(t, w, checkpointWorkload1)
+
+	fakeCheckpointMetrics := workload.CheckpointMetrics{UUID: uuid.New()}
+	completedOp, err = s.WorkloadCompleted(workload.CompletedMessage{
+		Workload:          checkpointWorkload1,
+		CheckpointMetrics: &fakeCheckpointMetrics,
+	}, nil)
+	assert.NilError(t, err)
+	assert.Assert(t, completedOp == nil, "should not have finished %v yet", train)
+
+	// Check that the sequencer trains again, rather than repeating the same checkpoint.
+	w, err = s.Workload()
+	assert.NilError(t, err)
+	assert.Equal(t, w, workload.Workload{
+		Kind:                  workload.RunStep,
+		ExperimentID:          1,
+		TrialID:               1,
+		StepID:                2,
+		NumBatches:            1,
+		PriorBatchesProcessed: 1,
+	})
+}